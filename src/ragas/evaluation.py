@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import typing as t
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 import numpy as np
 from datasets import Dataset, concatenate_datasets
@@ -73,11 +73,12 @@ def evaluate(
         embeddings does not support async then the evaluation can be run in sync mode
         with `is_async=False`. Default is False.
     max_workers: int, optional
-        The number of workers to use for the evaluation. This is used by the
-        `ThreadpoolExecutor` to run the evaluation in sync mode.
+        The maximum number of metric evaluations to run concurrently. Overrides
+        `run_config.max_workers` when set, otherwise `run_config.max_workers`
+        (16 by default) is used.
     run_config: RunConfig, optional
-        Configuration for runtime settings like timeout and retries. If not provided,
-        default values are used.
+        Configuration for runtime settings like timeout, retries and the number of
+        concurrent workers. If not provided, default values are used.
     raise_exceptions: bool, optional
         Whether to raise exceptions or not. If set to True then the evaluation will
         raise an exception if any of the metrics fail. If set to False then the
@@ -125,6 +126,8 @@ def evaluate(
     # default run_config
     if run_config is None:
         run_config = RunConfig()
+    if max_workers is not None:
+        run_config = replace(run_config, max_workers=max_workers)
     # default metrics
     if metrics is None:
         from ragas.metrics import (
@@ -183,6 +186,7 @@ def evaluate(
         desc="Evaluating",
         keep_progress_bar=True,
         raise_exceptions=raise_exceptions,
+        run_config=run_config,
     )
     # new evaluation chain
     row_run_managers = []
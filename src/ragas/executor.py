@@ -10,6 +10,7 @@ import numpy as np
 from tqdm.auto import tqdm
 
 from ragas.exceptions import MaxRetriesExceeded
+from ragas.run_config import RunConfig
 
 logger = logging.getLogger(__name__)
 
@@ -30,22 +31,34 @@ class Runner(threading.Thread):
         desc: str,
         keep_progress_bar: bool = True,
         raise_exceptions: bool = True,
+        run_config: t.Optional[RunConfig] = None,
     ):
         super().__init__()
         self.jobs = jobs
         self.desc = desc
         self.keep_progress_bar = keep_progress_bar
         self.raise_exceptions = raise_exceptions
+        self.run_config = run_config or RunConfig()
         self.futures = []
-
-        # create task
         self.loop = asyncio.new_event_loop()
-        for job in self.jobs:
-            coroutine, name = job
-            self.futures.append(self.loop.create_task(coroutine, name=name))
 
     async def _aresults(self) -> t.List[t.Any]:
-        results = []
+        # the semaphore has to be created inside the running loop
+        semaphore = asyncio.Semaphore(self.run_config.max_workers)
+
+        async def sema_coroutine(coroutine: t.Coroutine):
+            async with semaphore:
+                return await coroutine
+
+        # create tasks, at most max_workers of them run at a time
+        for coroutine, name in self.jobs:
+            self.futures.append(
+                asyncio.create_task(sema_coroutine(coroutine), name=name)
+            )
+
+        # results are placed at their submission index as they complete, jobs
+        # that fail keep np.nan in their slot
+        results: t.List[t.Any] = [np.nan] * len(self.futures)
         for future in tqdm(
             asyncio.as_completed(self.futures),
             desc=self.desc,
@@ -53,9 +66,9 @@ class Runner(threading.Thread):
             # whether you want to keep the progress bar after completion
             leave=self.keep_progress_bar,
         ):
-            r = (-1, np.nan)
             try:
-                r = await future
+                i, r = await future
+                results[i] = r
             except MaxRetriesExceeded as e:
                 logger.warning(f"max retries exceeded for {e.evolution}")
             except Exception as e:
@@ -65,7 +78,6 @@ class Runner(threading.Thread):
                     logger.error(
                         "Runner in Executor raised an exception", exc_info=True
                     )
-            results.append(r)
 
         return results
 
@@ -85,6 +97,7 @@ class Executor:
     keep_progress_bar: bool = True
     jobs: t.List[t.Any] = field(default_factory=list, repr=False)
     raise_exceptions: bool = False
+    run_config: t.Optional[RunConfig] = field(default=None, repr=False)
 
     def wrap_callable_with_index(self, callable: t.Callable, counter):
         async def wrapped_callable_async(*args, **kwargs):
@@ -104,6 +117,7 @@ class Executor:
             desc=self.desc,
             keep_progress_bar=self.keep_progress_bar,
             raise_exceptions=self.raise_exceptions,
+            run_config=self.run_config,
         )
         executor_job.start()
         try:
@@ -119,5 +133,4 @@ class Executor:
             else:
                 logger.error("Executor failed to complete. Please check logs above.")
                 return []
-        sorted_results = sorted(executor_job.results, key=lambda x: x[0])
-        return [r[1] for r in sorted_results]
+        return executor_job.results
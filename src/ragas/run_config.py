@@ -14,17 +14,22 @@ from tenacity import (
 @dataclass
 class RunConfig:
     """
-    Configuration for a timeouts and retries.
+    Configuration for a timeouts, retries and concurrency.
     """
 
     timeout: int = 60
     max_retries: int = 10
     max_wait: int = 60
+    max_workers: int = 16
     exception_types: t.Union[
         t.Type[BaseException],
         t.Tuple[t.Type[BaseException], ...],
     ] = Exception
 
+    def __post_init__(self):
+        if self.max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1 [got {self.max_workers}]")
+
 
 def add_retry(fn: WrappedFn, run_config: RunConfig) -> WrappedFn:
     r = Retrying(
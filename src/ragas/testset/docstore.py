@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import heapq
+import json
 import logging
+import os
+import pickle
 import typing as t
 import uuid
 from abc import ABC, abstractmethod
@@ -28,6 +30,8 @@ if t.TYPE_CHECKING:
 Embedding = t.Union[t.List[float], npt.NDArray[np.float64]]
 logger = logging.getLogger(__name__)
 
+DOCSTORE_FORMAT_VERSION = 1
+
 
 class Document(LCDocument):
     doc_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -89,7 +93,7 @@ class DocumentStore(ABC):
         self.documents = {}
 
     @abstractmethod
-    def add_documents(self, docs: t.Sequence[Document], show_progress=True):
+    def add_documents(self, docs: t.Iterable[Document], show_progress=True):
         ...
 
     @abstractmethod
@@ -148,9 +152,27 @@ def similarity(
 default_similarity_fns = similarity
 
 
+def similarities(
+    query_embedding: npt.NDArray,
+    embeddings: npt.NDArray,
+    mode: SimilarityMode = SimilarityMode.DEFAULT,
+) -> npt.NDArray:
+    """Get similarity of the query embedding against every row of embeddings."""
+    if mode == SimilarityMode.EUCLIDEAN:
+        # Using -euclidean distance as similarity to achieve same ranking order
+        return -np.linalg.norm(embeddings - query_embedding, axis=1)
+    elif mode == SimilarityMode.DOT_PRODUCT:
+        return embeddings @ query_embedding
+    else:
+        product = embeddings @ query_embedding
+        norm = np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return product / norm
+
+
 def get_top_k_embeddings(
     query_embedding: Embedding,
-    embeddings: t.List[Embedding],
+    embeddings: t.Union[t.List[Embedding], npt.NDArray],
     similarity_fn: t.Optional[t.Callable[..., float]] = None,
     similarity_top_k: t.Optional[int] = None,
     embedding_ids: t.Optional[t.List] = None,
@@ -162,23 +184,28 @@ def get_top_k_embeddings(
     """
     if embedding_ids is None:
         embedding_ids = list(range(len(embeddings)))
+    if len(embeddings) == 0:
+        return [], []
 
-    similarity_fn = similarity_fn or default_similarity_fns
+    embeddings_np = np.asarray(embeddings)
+    query_embedding_np = np.asarray(query_embedding, dtype=embeddings_np.dtype)
 
-    embeddings_np = np.array(embeddings)
-    query_embedding_np = np.array(query_embedding)
+    if similarity_fn is None:
+        scores = similarities(query_embedding_np, embeddings_np)
+    else:
+        scores = np.array(
+            [similarity_fn(query_embedding_np, emb) for emb in embeddings_np]
+        )
 
-    similarity_heap: t.List[t.Tuple[float, t.Any]] = []
-    for i, emb in enumerate(embeddings_np):
-        similarity = similarity_fn(query_embedding_np, emb)
-        if similarity_cutoff is None or similarity > similarity_cutoff:
-            heapq.heappush(similarity_heap, (similarity, embedding_ids[i]))
-            if similarity_top_k and len(similarity_heap) > similarity_top_k:
-                heapq.heappop(similarity_heap)
-    result_tups = sorted(similarity_heap, key=lambda x: x[0], reverse=True)
+    top_idxs = np.arange(len(scores))
+    if similarity_cutoff is not None:
+        top_idxs = top_idxs[scores > similarity_cutoff]
+    top_idxs = top_idxs[np.argsort(-scores[top_idxs], kind="stable")]
+    if similarity_top_k:
+        top_idxs = top_idxs[:similarity_top_k]
 
-    result_similarities = [s for s, _ in result_tups]
-    result_ids = [n for _, n in result_tups]
+    result_similarities = scores[top_idxs].tolist()
+    result_ids = [embedding_ids[i] for i in top_idxs]
 
     return result_similarities, result_ids
 
@@ -189,15 +216,29 @@ class InMemoryDocumentStore(DocumentStore):
     extractor: t.Optional[Extractor] = field(default=None, repr=False)
     embeddings: t.Optional[BaseRagasEmbeddings] = field(default=None, repr=False)
     nodes: t.List[Node] = field(default_factory=list)
-    node_embeddings_list: t.List[Embedding] = field(default_factory=list)
+    node_embeddings: npt.NDArray[np.float32] = field(
+        default_factory=lambda: np.empty((0, 0), dtype=np.float32), repr=False
+    )
     node_map: t.Dict[str, Node] = field(default_factory=dict)
+    node_scores: t.Dict[bytes, t.Dict] = field(default_factory=dict, repr=False)
+    run_config: t.Optional[RunConfig] = field(default=None, repr=False)
 
     def _embed_items(self, items: t.Union[t.Sequence[Document], t.Sequence[Node]]):
         ...
 
-    def add_documents(self, docs: t.Sequence[Document], show_progress=True):
+    def _add_embeddings(self, embeddings: t.Sequence[Embedding]):
+        if len(embeddings) == 0:
+            return
+        new_embeddings = np.asarray(embeddings, dtype=np.float32)
+        if len(self.node_embeddings) == 0:
+            self.node_embeddings = np.ascontiguousarray(new_embeddings)
+        else:
+            self.node_embeddings = np.vstack([self.node_embeddings, new_embeddings])
+
+    def add_documents(self, docs: t.Iterable[Document], show_progress=True):
         """
-        Add documents in batch mode.
+        Add documents in batch mode. Documents can be any iterable, they are
+        consumed once by the splitter.
         """
         assert self.embeddings is not None, "Embeddings must be set"
 
@@ -221,9 +262,10 @@ class InMemoryDocumentStore(DocumentStore):
 
         # get embeddings for the docs
         executor = Executor(
-            desc="embedding nodes",
+            desc=desc,
             keep_progress_bar=False,
             raise_exceptions=True,
+            run_config=self.run_config,
         )
         result_idx = 0
         for i, n in enumerate(nodes):
@@ -249,6 +291,7 @@ class InMemoryDocumentStore(DocumentStore):
         if results == []:
             raise ExceptionInRunner()
 
+        new_embeddings = []
         for i, n in enumerate(nodes):
             if i in nodes_to_embed.keys():
                 n.embedding = results[nodes_to_embed[i]]
@@ -262,7 +305,8 @@ class InMemoryDocumentStore(DocumentStore):
                 assert isinstance(
                     n.embedding, (list, np.ndarray)
                 ), "Embedding must be list or np.ndarray"
-                self.node_embeddings_list.append(n.embedding)
+                new_embeddings.append(n.embedding)
+        self._add_embeddings(new_embeddings)
 
     def get_node(self, node_id: str) -> Node:
         return self.node_map[node_id]
@@ -282,8 +326,7 @@ class InMemoryDocumentStore(DocumentStore):
             raise ValueError("Document has no embedding.")
         scores, doc_ids = get_top_k_embeddings(
             query_embedding=doc.embedding,
-            embeddings=self.node_embeddings_list,
-            similarity_fn=similarity,
+            embeddings=self.node_embeddings,
             similarity_cutoff=threshold,
             # we need to return k+1 docs here as the top result is the input doc itself
             similarity_top_k=top_k + 1,
@@ -319,5 +362,79 @@ class InMemoryDocumentStore(DocumentStore):
                 return None
 
     def set_run_config(self, run_config: RunConfig):
+        self.run_config = run_config
         if self.embeddings:
             self.embeddings.set_run_config(run_config)
+
+    def save(self, path: str) -> None:
+        """
+        Save the embedded nodes so that they can be reused with `load` without
+        calling the embedding model and extractor again. Nodes (without their
+        embeddings) and filter scores are written to `{path}.meta.pkl`, the
+        embedding matrix to `{path}.emb.npy` and a manifest describing both to
+        `{path}.json`. Row i of the matrix is the embedding of node i.
+        """
+        # embeddings only live in the .npy file, `load` restores them on the nodes
+        stripped = {id(n): n.copy(update={"embedding": None}) for n in self.nodes}
+        nodes = [stripped[id(n)] for n in self.nodes]
+        node_map = {
+            doc_id: stripped.get(id(n), n.copy(update={"embedding": None}))
+            for doc_id, n in self.node_map.items()
+        }
+        with open(f"{path}.meta.pkl", "wb") as f:
+            pickle.dump(
+                (nodes, node_map, self.node_scores),
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        np.save(f"{path}.emb.npy", self.node_embeddings)
+        # the manifest is written last so an interrupted save is never loaded
+        with open(f"{path}.json", "w") as f:
+            json.dump(
+                {
+                    "version": DOCSTORE_FORMAT_VERSION,
+                    "num_nodes": len(self.nodes),
+                    "embedding_shape": list(self.node_embeddings.shape),
+                    "embedding_dtype": str(self.node_embeddings.dtype),
+                },
+                f,
+            )
+
+    def load(self, path: str) -> None:
+        """
+        Load nodes saved with `save` into the docstore. The embedding matrix is
+        memory-mapped so vectors are only paged in when they are searched.
+        """
+        if os.path.exists(f"{path}.json"):
+            with open(f"{path}.json") as f:
+                manifest = json.load(f)
+            version = manifest.get("version")
+            if version != DOCSTORE_FORMAT_VERSION:
+                raise ValueError(
+                    f"Saved docstore at {path} has unsupported format version "
+                    f"[got {version}, expected {DOCSTORE_FORMAT_VERSION}]"
+                )
+            with open(f"{path}.meta.pkl", "rb") as f:
+                nodes, node_map, node_scores = pickle.load(f)
+            node_embeddings = np.load(f"{path}.emb.npy", mmap_mode="r")
+            if not (
+                len(nodes) == manifest["num_nodes"] == len(node_embeddings)
+                and list(node_embeddings.shape) == manifest["embedding_shape"]
+                and str(node_embeddings.dtype) == manifest["embedding_dtype"]
+            ):
+                raise ValueError(
+                    f"Saved docstore at {path} does not match its manifest"
+                )
+            self.node_scores.update(node_scores)
+        else:
+            # single file written by older versions of `save`
+            with open(path, "rb") as f:
+                nodes, node_map, node_embeddings = pickle.load(f)
+        offset = len(self.node_embeddings)
+        self.nodes.extend(nodes)
+        self.node_map.update(node_map)
+        self._add_embeddings(node_embeddings)
+        # point nodes saved without embeddings at their row of the matrix
+        for i, n in enumerate(nodes):
+            if n.embedding is None:
+                n.embedding = self.node_embeddings[offset + i]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import typing as t
 from abc import ABC
@@ -48,13 +49,36 @@ class NodeFilter(Filter):
     context_scoring_prompt: Prompt = field(
         default_factory=lambda: context_scoring_prompt
     )
+    # raw scores from the llm keyed by a hash of the critic, prompt and content
+    cache: t.Dict[bytes, t.Dict] = field(default_factory=dict, repr=False)
+
+    def _cache_key(self, node: Node) -> bytes:
+        # a score is only reusable for the same critic model and scoring prompt
+        llm = getattr(self.llm, "langchain_llm", self.llm)
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+        key = hashlib.blake2b(digest_size=8)
+        for part in (
+            f"{type(llm).__name__}:{model}",
+            self.context_scoring_prompt.json(),
+            node.page_content,
+        ):
+            key.update(part.encode())
+            key.update(b"\0")
+        return key.digest()
 
     async def filter(self, node: Node) -> t.Dict:
-        prompt = self.context_scoring_prompt.format(context=node.page_content)
-        results = await self.llm.generate(prompt=prompt)
-        output = results.generations[0][0].text.strip()
-        score = await json_loader.safe_load(output, llm=self.llm)
-        score = score if isinstance(score, dict) else {}
+        key = self._cache_key(node)
+        if key in self.cache:
+            score = dict(self.cache[key])
+        else:
+            prompt = self.context_scoring_prompt.format(context=node.page_content)
+            results = await self.llm.generate(prompt=prompt)
+            output = results.generations[0][0].text.strip()
+            score = await json_loader.safe_load(output, llm=self.llm)
+            score = score if isinstance(score, dict) else {}
+            # don't remember failed parses, the node is scored again next time
+            if "score" in score:
+                self.cache[key] = dict(score)
         logger.debug("node filter: %s", score)
         score.update({"score": score.get("score", 0) >= self.threshold})
         return score
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
 import logging
+import math
 import typing as t
 from dataclasses import dataclass
-from random import choices
 
 import pandas as pd
-from datasets import Dataset
-from langchain_openai.chat_models import ChatOpenAI
-from langchain_openai.embeddings import OpenAIEmbeddings
 
 from ragas._analytics import TesetGenerationEvent, track
 from ragas.embeddings.base import BaseRagasEmbeddings, LangchainEmbeddingsWrapper
@@ -28,9 +25,10 @@ from ragas.testset.evolutions import (
 )
 from ragas.testset.extractor import KeyphraseExtractor
 from ragas.testset.filters import EvolutionFilter, NodeFilter, QuestionFilter
-from ragas.utils import check_if_sum_is_close, get_feature_language, is_nan
+from ragas.utils import check_if_sum_is_close, get_feature_language
 
 if t.TYPE_CHECKING:
+    from datasets import Dataset
     from langchain_core.documents import Document as LCDocument
     from llama_index.core.schema import Document as LlamaindexDocument
 
@@ -49,18 +47,24 @@ class TestDataset:
     test_data: t.List[DataRow]
 
     def _to_records(self) -> t.List[t.Dict]:
-        data_samples = []
-        for data in self.test_data:
-            data_dict = dict(data)
-            data_dict["episode_done"] = True
-            data_samples.append(data_dict)
-        return data_samples
+        columns = self._to_columns()
+        return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+    def _to_columns(self) -> t.Dict[str, t.List]:
+        columns = {
+            name: [getattr(data, name) for data in self.test_data]
+            for name in DataRow.__fields__
+        }
+        columns["episode_done"] = [True] * len(self.test_data)
+        return columns
 
     def to_pandas(self) -> pd.DataFrame:
-        return pd.DataFrame.from_records(self._to_records())
+        return pd.DataFrame(self._to_columns())
 
     def to_dataset(self) -> Dataset:
-        return Dataset.from_list(self._to_records())
+        from datasets import Dataset
+
+        return Dataset.from_dict(self._to_columns())
 
 
 @dataclass
@@ -79,8 +83,15 @@ class TestsetGenerator:
         docstore: t.Optional[DocumentStore] = None,
         chunk_size: int = 512,
     ) -> "TestsetGenerator":
-        generator_llm_model = LangchainLLMWrapper(ChatOpenAI(model=generator_llm))
-        critic_llm_model = LangchainLLMWrapper(ChatOpenAI(model=critic_llm))
+        from langchain_openai.chat_models import ChatOpenAI
+        from langchain_openai.embeddings import OpenAIEmbeddings
+
+        # build one client per model so the same model shares a connection pool
+        chat_models = {
+            model: ChatOpenAI(model=model) for model in {generator_llm, critic_llm}
+        }
+        generator_llm_model = LangchainLLMWrapper(chat_models[generator_llm])
+        critic_llm_model = LangchainLLMWrapper(chat_models[critic_llm])
         embeddings_model = LangchainEmbeddingsWrapper(
             OpenAIEmbeddings(model=embeddings)
         )
@@ -122,7 +133,7 @@ class TestsetGenerator:
     ):
         # chunk documents and add to docstore
         self.docstore.add_documents(
-            [Document.from_llamaindex_document(doc) for doc in documents]
+            Document.from_llamaindex_document(doc) for doc in documents
         )
 
         return self.generate(
@@ -148,7 +159,7 @@ class TestsetGenerator:
     ):
         # chunk documents and add to docstore
         self.docstore.add_documents(
-            [Document.from_langchain_document(doc) for doc in documents]
+            Document.from_langchain_document(doc) for doc in documents
         )
 
         return self.generate(
@@ -170,6 +181,9 @@ class TestsetGenerator:
                 evolution.question_filter = QuestionFilter(llm=self.critic_llm)
             if evolution.node_filter is None:
                 evolution.node_filter = NodeFilter(llm=self.critic_llm)
+                if isinstance(self.docstore, InMemoryDocumentStore):
+                    # share node scores across evolutions and saved docstores
+                    evolution.node_filter.cache = self.docstore.node_scores
 
             if isinstance(evolution, ComplexEvolution):
                 if evolution.evolution_filter is None:
@@ -184,10 +198,16 @@ class TestsetGenerator:
         raise_exceptions: bool = True,
         run_config: t.Optional[RunConfig] = None,
     ):
-        # validate distributions
-        if not check_if_sum_is_close(list(distributions.values()), 1.0, 3):
+        dist_items = list(distributions.items())
+        evolutions = [e for e, _ in dist_items]
+        probs = [p for _, p in dist_items]
+
+        # validate distributions, the default one is known to sum to 1.0
+        if distributions is not DEFAULT_DISTRIBUTION and not check_if_sum_is_close(
+            probs, 1.0, 3
+        ):
             raise ValueError(
-                f"distributions passed do not sum to 1.0 [got {sum(list(distributions.values()))}]. Please check the distributions."
+                f"distributions passed do not sum to 1.0 [got {sum(probs)}]. Please check the distributions."
             )
 
         # configure run_config for docstore
@@ -196,7 +216,7 @@ class TestsetGenerator:
         self.docstore.set_run_config(run_config)
 
         # init filters and evolutions
-        for evolution in distributions:
+        for evolution in evolutions:
             self.init_evolution(evolution)
             evolution.init(is_async=is_async, run_config=run_config)
 
@@ -213,26 +233,24 @@ class TestsetGenerator:
             desc="Generating",
             keep_progress_bar=True,
             raise_exceptions=raise_exceptions,
+            run_config=run_config,
         )
 
         current_nodes = [
             CurrentNodes(root_node=n, nodes=[n])
             for n in self.docstore.get_random_nodes(k=test_size)
         ]
+        # each evolution gets its own root node. test_size is apportioned with
+        # the largest remainder method so the counts add up to exactly test_size
+        quotas = [p / sum(probs) * test_size for p in probs]
+        counts = [math.floor(q) for q in quotas]
+        by_remainder = sorted(range(len(quotas)), key=lambda i: counts[i] - quotas[i])
+        for i in by_remainder[: test_size - sum(counts)]:
+            counts[i] += 1
+
         total_evolutions = 0
-        for evolution, probability in distributions.items():
-            for i in range(round(probability * test_size)):
-                exec.submit(
-                    evolution.evolve,
-                    current_nodes[i],
-                    name=f"{evolution.__class__.__name__}-{i}",
-                )
-                total_evolutions += 1
-        if total_evolutions <= test_size:
-            filler_evolutions = choices(
-                list(distributions), k=test_size - total_evolutions
-            )
-            for evolution in filler_evolutions:
+        for evolution, count in zip(evolutions, counts):
+            for _ in range(count):
                 exec.submit(
                     evolution.evolve,
                     current_nodes[total_evolutions],
@@ -249,15 +267,16 @@ class TestsetGenerator:
             raise e
         # make sure to ignore any NaNs that might have been returned
         # due to failed evolutions. MaxRetriesExceeded is a common reason
-        test_data_rows = [r for r in test_data_rows if not is_nan(r)]
-        test_dataset = TestDataset(test_data=test_data_rows)
-        evol_lang = [get_feature_language(e) for e in distributions]
+        test_dataset = TestDataset(
+            test_data=[r for r in test_data_rows if isinstance(r, DataRow)]
+        )
+        evol_lang = [get_feature_language(e) for e in evolutions]
         evol_lang = [e for e in evol_lang if e is not None]
         track(
             TesetGenerationEvent(
                 event_type="testset_generation",
-                evolution_names=[e.__class__.__name__.lower() for e in distributions],
-                evolution_percentages=[distributions[e] for e in distributions],
+                evolution_names=[e.__class__.__name__.lower() for e in evolutions],
+                evolution_percentages=probs,
                 num_rows=len(test_dataset.test_data),
                 language=evol_lang[0] if len(evol_lang) > 0 else "",
             )
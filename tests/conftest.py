@@ -6,6 +6,7 @@ import pytest
 from langchain_core.outputs import Generation, LLMResult
 
 from ragas.llms.base import BaseRagasLLM
+from ragas.run_config import RunConfig
 
 if t.TYPE_CHECKING:
     from ragas.llms.prompt import PromptValue
@@ -29,4 +30,4 @@ class FakeTestLLM(BaseRagasLLM):
 
 @pytest.fixture
 def fake_llm():
-    return FakeTestLLM()
+    return FakeTestLLM(run_config=RunConfig())
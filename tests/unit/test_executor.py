@@ -0,0 +1,45 @@
+import asyncio
+
+import numpy as np
+
+from ragas.executor import Executor
+from ragas.run_config import RunConfig
+
+
+def test_executor_respects_max_workers():
+    running = 0
+    max_running = 0
+
+    async def job(i):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return i
+
+    executor = Executor(
+        desc="test", keep_progress_bar=False, run_config=RunConfig(max_workers=2)
+    )
+    for i in range(10):
+        executor.submit(job, i, name=f"job-{i}")
+
+    assert executor.results() == list(range(10))
+    assert max_running == 2
+
+
+def test_executor_keeps_order_when_jobs_fail():
+    async def job(i):
+        await asyncio.sleep(0.01 * (5 - i))
+        if i == 2:
+            raise ValueError("failed job")
+        return i
+
+    executor = Executor(desc="test", keep_progress_bar=False, raise_exceptions=False)
+    for i in range(5):
+        executor.submit(job, i, name=f"job-{i}")
+
+    results = executor.results()
+    assert results[:2] == [0, 1]
+    assert np.isnan(results[2])
+    assert results[3:] == [3, 4]
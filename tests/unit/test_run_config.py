@@ -0,0 +1,9 @@
+import pytest
+
+from ragas.run_config import RunConfig
+
+
+@pytest.mark.parametrize("max_workers", [0, -1])
+def test_run_config_rejects_invalid_max_workers(max_workers):
+    with pytest.raises(ValueError):
+        RunConfig(max_workers=max_workers)
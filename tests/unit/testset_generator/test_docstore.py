@@ -1,3 +1,4 @@
+import json
 import os
 import pickle
 import typing as t
@@ -7,7 +8,14 @@ import pytest
 from langchain.text_splitter import TokenTextSplitter
 from langchain_core.embeddings import Embeddings
 
-from ragas.testset.docstore import Direction, InMemoryDocumentStore, Node
+from ragas.testset.docstore import (
+    Direction,
+    InMemoryDocumentStore,
+    Node,
+    SimilarityMode,
+    similarities,
+    similarity,
+)
 
 
 class FakeEmbeddings(Embeddings):
@@ -78,13 +86,35 @@ def create_test_nodes(with_embeddings=True):
     return a1, a2, b
 
 
+@pytest.mark.parametrize("mode", list(SimilarityMode))
+def test_similarities_match_similarity(mode):
+    embeddings = np.array([n.embedding for n in create_test_nodes()])
+    query = embeddings[0]
+
+    expected = [similarity(query, emb, mode=mode) for emb in embeddings]
+    assert np.allclose(similarities(query, embeddings, mode=mode), expected)
+
+
+def test_euclidean_similarities_rank_near_duplicates():
+    query = np.random.default_rng(0).random(1536, dtype=np.float32) * 10
+    embeddings = np.stack([query, query + 1e-3, query + 2e-3])
+
+    scores = similarities(query, embeddings, mode=SimilarityMode.EUCLIDEAN)
+    expected = [
+        similarity(query, emb, mode=SimilarityMode.EUCLIDEAN) for emb in embeddings
+    ]
+    assert list(np.argsort(-scores)) == [0, 1, 2]
+    assert list(np.argsort(-scores)) == list(np.argsort(-np.array(expected)))
+
 def test_similar_nodes():
     a1, a2, b = create_test_nodes()
     fake_embeddings = FakeEmbeddings()
     splitter = TokenTextSplitter(chunk_size=100, chunk_overlap=0)
     store = InMemoryDocumentStore(splitter=splitter, embeddings=fake_embeddings)
     store.nodes = [a1, a2, b]
-    store.node_embeddings_list = [d.embedding for d in store.nodes]
+    store.node_embeddings = np.array(
+        [d.embedding for d in store.nodes], dtype=np.float32
+    )
 
     assert store.get_similar(a1)[0] == a2
     assert store.get_similar(a2)[0] == a1
@@ -99,7 +129,9 @@ def test_similar_nodes_scaled():
     splitter = TokenTextSplitter(chunk_size=100, chunk_overlap=0)
     store = InMemoryDocumentStore(splitter=splitter, embeddings=fake_embeddings)
     store.nodes = [a1, a2, b] + [b] * 100
-    store.node_embeddings_list = [d.embedding for d in store.nodes]
+    store.node_embeddings = np.array(
+        [d.embedding for d in store.nodes], dtype=np.float32
+    )
 
     assert len(store.get_similar(a1, top_k=3)) == 3
     assert store.get_similar(a1)[0] == a2
@@ -120,7 +152,7 @@ def test_docstore_add(fake_llm):
         store.add_nodes([doc])
         docs_added.append(doc)
         assert store.nodes == docs_added
-        assert store.node_embeddings_list == [d.embedding for d in docs_added]
+        assert np.allclose(store.node_embeddings, [d.embedding for d in docs_added])
         assert np.all([node.keyphrases != [] for node in store.nodes])
 
     assert store.get_node(a1.doc_id) == a1
@@ -164,5 +196,102 @@ def test_docstore_add_batch(fake_llm):
     assert len(store.get_node(d.doc_id).keyphrases) == 1
     assert store.get_node(d.doc_id).embedding == [0.0] * 768
     assert len(store.nodes) == 5
-    assert len(store.node_embeddings_list) == 5
+    assert len(store.node_embeddings) == 5
     assert len(store.node_map) == 5
+
+
+def test_docstore_save_load(tmp_path):
+    fake_embeddings = FakeEmbeddings()
+    store = InMemoryDocumentStore(splitter=None, embeddings=fake_embeddings)  # type: ignore
+    store.nodes = list(create_test_nodes())
+    store.node_map = {n.doc_id: n for n in store.nodes}
+    store.node_embeddings = np.array(
+        [n.embedding for n in store.nodes], dtype=np.float32
+    )
+    store.node_scores = {b"a1": {"score": 8}}
+
+    path = str(tmp_path / "docstore")
+    store.save(path)
+    with open(f"{path}.json") as f:
+        manifest = json.load(f)
+    assert manifest["num_nodes"] == 3
+    assert manifest["embedding_shape"] == list(store.node_embeddings.shape)
+
+    loaded = InMemoryDocumentStore(splitter=None, embeddings=fake_embeddings)  # type: ignore
+    loaded.load(path)
+    assert [n.doc_id for n in loaded.nodes] == [n.doc_id for n in store.nodes]
+    assert loaded.get_node("a1") is loaded.nodes[0]
+    assert np.array_equal(loaded.node_embeddings, store.node_embeddings)
+    assert loaded.node_scores == store.node_scores
+    for node, expected in zip(loaded.nodes, store.nodes):
+        assert np.allclose(node.embedding, expected.embedding)
+
+    # embeddings are only stored in the .npy file
+    with open(f"{path}.meta.pkl", "rb") as f:
+        nodes, node_map, _ = pickle.load(f)
+    assert all(n.embedding is None for n in nodes)
+    assert all(n.embedding is None for n in node_map.values())
+    assert store.nodes[0].embedding is not None
+
+    # nodes are matched to embedding rows by position, so a mismatch is rejected
+    np.save(f"{path}.emb.npy", store.node_embeddings[:2])
+    with pytest.raises(ValueError):
+        InMemoryDocumentStore(splitter=None).load(path)  # type: ignore
+
+    # manifests from an unknown format version are rejected before unpickling
+    with open(f"{path}.json") as f:
+        manifest = json.load(f)
+    with open(f"{path}.json", "w") as f:
+        json.dump({**manifest, "version": manifest["version"] + 1}, f)
+    with pytest.raises(ValueError, match="format version"):
+        InMemoryDocumentStore(splitter=None).load(path)  # type: ignore
+
+
+def test_docstore_load_single_file(tmp_path):
+    nodes = list(create_test_nodes())
+    path = str(tmp_path / "docstore.pkl")
+    with open(path, "wb") as f:
+        pickle.dump(
+            (nodes, {n.doc_id: n for n in nodes}, [n.embedding for n in nodes]), f
+        )
+
+    store = InMemoryDocumentStore(splitter=None)  # type: ignore
+    store.load(path)
+    assert [n.doc_id for n in store.nodes] == ["a1", "a2", "b"]
+    assert store.node_embeddings.shape == (3, len(nodes[0].embedding))
+
+
+def test_docstore_add_documents_from_iterable():
+    class FakeSplitter:
+        def transform_documents(self, docs):
+            return list(docs)
+
+    class FakeRagasEmbeddings:
+        async def embed_text(self, text):
+            return [float(len(text)), 1.0]
+
+    class FakeExtractor:
+        async def extract(self, node):
+            return ["keyphrase"]
+
+    store = InMemoryDocumentStore(
+        splitter=FakeSplitter(),  # type: ignore
+        embeddings=FakeRagasEmbeddings(),  # type: ignore
+        extractor=FakeExtractor(),  # type: ignore
+    )
+    contents = ["a", "bb", "ccc", "dddd", "eeeee"]
+    add_nodes_calls = []
+    add_nodes = store.add_nodes
+
+    def counting_add_nodes(nodes, **kwargs):
+        add_nodes_calls.append(len(nodes))
+        add_nodes(nodes, **kwargs)
+
+    store.add_nodes = counting_add_nodes  # type: ignore
+    store.add_documents(Node(page_content=c, filename="f") for c in contents)
+
+    assert [n.page_content for n in store.nodes] == contents
+    assert store.node_embeddings.shape == (5, 2)
+    assert store.node_embeddings[:, 0].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    # all nodes are embedded by a single executor run
+    assert add_nodes_calls == [5]
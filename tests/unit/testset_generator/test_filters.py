@@ -0,0 +1,58 @@
+import pytest
+
+from ragas.testset.docstore import Node
+from ragas.testset.filters import NodeFilter
+
+
+def patch_llm_score(monkeypatch, score):
+    async def safe_load(text, llm, **kwargs):
+        return score
+
+    monkeypatch.setattr("ragas.testset.filters.json_loader.safe_load", safe_load)
+
+
+@pytest.mark.asyncio
+async def test_node_filter_cache(fake_llm, monkeypatch):
+    node_filter = NodeFilter(llm=fake_llm, threshold=5)
+    node = Node(page_content="cached content")
+
+    patch_llm_score(monkeypatch, {"score": 6})
+    assert (await node_filter.filter(node))["score"] is True
+    assert len(node_filter.cache) == 1
+
+    # cached scores are reused and thresholded without calling the llm again
+    patch_llm_score(monkeypatch, {"score": 1})
+    assert (await node_filter.filter(node))["score"] is True
+    node_filter.threshold = 7
+    assert (await node_filter.filter(node))["score"] is False
+    assert len(node_filter.cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_node_filter_cache_skips_failed_parses(fake_llm, monkeypatch):
+    node_filter = NodeFilter(llm=fake_llm, threshold=5)
+    node = Node(page_content="unparseable content")
+
+    patch_llm_score(monkeypatch, {})
+    assert (await node_filter.filter(node))["score"] is False
+    assert node_filter.cache == {}
+
+    patch_llm_score(monkeypatch, {"score": 6})
+    assert (await node_filter.filter(node))["score"] is True
+
+
+@pytest.mark.asyncio
+async def test_node_filter_cache_depends_on_prompt(fake_llm, monkeypatch):
+    node_filter = NodeFilter(llm=fake_llm, threshold=5)
+    node = Node(page_content="adapted content")
+
+    patch_llm_score(monkeypatch, {"score": 6})
+    await node_filter.filter(node)
+
+    # an adapted prompt must not reuse scores from the previous one
+    node_filter.context_scoring_prompt = node_filter.context_scoring_prompt.copy(
+        update={"language": "spanish"}
+    )
+    patch_llm_score(monkeypatch, {"score": 1})
+    assert (await node_filter.filter(node))["score"] is False
+    assert len(node_filter.cache) == 2
@@ -0,0 +1,88 @@
+import pytest
+
+from ragas.testset.docstore import InMemoryDocumentStore, Node
+from ragas.testset.evolutions import DataRow
+from ragas.testset.generator import TestDataset as RagasTestDataset
+from ragas.testset.generator import TestsetGenerator as RagasTestsetGenerator
+
+
+class FakeEvolution:
+    def __init__(self):
+        # set so that TestsetGenerator.init_evolution leaves it alone
+        self.generator_llm = object()
+        self.seen_nodes = []
+
+    def init(self, is_async=True, run_config=None):
+        pass
+
+    async def evolve(self, current_nodes):
+        self.seen_nodes.append(current_nodes)
+        return DataRow(
+            question=current_nodes.root_node.page_content,
+            contexts=[current_nodes.root_node.page_content],
+            ground_truth="",
+            evolution_type="fake",
+        )
+
+
+def test_testdataset_columns():
+    rows = [
+        DataRow(
+            question=f"question {i}",
+            contexts=[f"context {i}"],
+            ground_truth=f"answer {i}",
+            evolution_type="simple",
+        )
+        for i in range(3)
+    ]
+    test_dataset = RagasTestDataset(test_data=rows)
+    assert test_dataset._to_records() == [
+        {**dict(row), "episode_done": True} for row in rows
+    ]
+
+    df = test_dataset.to_pandas()
+    assert list(df.columns) == [
+        "question",
+        "contexts",
+        "ground_truth",
+        "evolution_type",
+        "episode_done",
+    ]
+    assert df.to_dict("records") == test_dataset._to_records()
+
+    ds = test_dataset.to_dataset()
+    assert ds.to_list() == test_dataset._to_records()
+
+
+@pytest.mark.parametrize(
+    "test_size, probs, expected_counts",
+    [
+        # 0.29 * 100 is 28.999999999999996 in floating point
+        (100, [0.29, 0.71], [29, 71]),
+        # 3.5 + 3.5 + 3.0 must not overshoot the test_size of 10
+        (10, [0.35, 0.35, 0.3], [4, 3, 3]),
+    ],
+)
+def test_generate_uses_each_root_node_once(
+    monkeypatch, test_size, probs, expected_counts
+):
+    monkeypatch.setattr("ragas.testset.generator.track", lambda event: None)
+    docstore = InMemoryDocumentStore(splitter=None)  # type: ignore
+    docstore.nodes = [Node(page_content=f"node {i}") for i in range(test_size)]
+    generator = RagasTestsetGenerator(
+        generator_llm=None,  # type: ignore
+        critic_llm=None,  # type: ignore
+        embeddings=None,  # type: ignore
+        docstore=docstore,
+    )
+    evolutions = [FakeEvolution() for _ in probs]
+
+    test_dataset = generator.generate(
+        test_size=test_size,
+        distributions=dict(zip(evolutions, probs)),
+    )
+
+    seen_nodes = [id(n) for e in evolutions for n in e.seen_nodes]
+    assert len(test_dataset.test_data) == test_size
+    assert len(set(seen_nodes)) == len(seen_nodes) == test_size
+    assert [len(e.seen_nodes) for e in evolutions] == expected_counts